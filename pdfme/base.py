@@ -1,4 +1,4 @@
-from typing import Any, Union
+from typing import Any, Iterable, Union
 from uuid import uuid4
 
 class PDFBase:
@@ -80,16 +80,43 @@ class PDFBase:
             PDFObject: A PDFObject representing the object added
         """
 
-        allowed_types = (
-            dict, list, tuple, set, bytes, bool, int, float, str, PDFObject
-        )
-        if not isinstance(py_obj, allowed_types):
+        if not isinstance(py_obj, ALLOWED_TYPES):
             raise TypeError('object type not allowed')
         obj = PDFObject(PDFRef(self.count), py_obj)
         self.content.append(obj)
         self.count += 1
         return obj
 
+    def add_many(self, py_objs: Iterable) -> list:
+        """Add several new objects to the PDF file at once.
+
+        This amortizes the per-object bookkeeping of method ``add`` when the
+        caller already has a batch of objects to register.
+
+        Args:
+            py_objs (iterable): An iterable of objects to be added, each of
+                the types accepted by method ``add``.
+
+        Raises:
+            TypeError: If any of the objects is not an allowed type.
+
+        Returns:
+            list: A list of PDFObject instances representing the objects
+            added, in the same order as ``py_objs``.
+        """
+        py_objs = list(py_objs)
+        for py_obj in py_objs:
+            if not isinstance(py_obj, ALLOWED_TYPES):
+                raise TypeError('object type not allowed')
+        count = self.count
+        objs = [
+            PDFObject(PDFRef(count + i), py_obj)
+            for i, py_obj in enumerate(py_objs)
+        ]
+        self.content.extend(objs)
+        self.count += len(objs)
+        return objs
+
     def __getitem__(self, i: int) -> 'PDFObject':
         if i == 0: return None
         return self.content[i - 1]
@@ -122,18 +149,18 @@ class PDFBase:
         """
         header = subs('%PDF-{}\n%%\x129\x129\x129\n', self.version)
         count = len(header)
-        buffer.write(header)
+        output_ = bytearray(header)
 
-        xref = '\nxref\n0 {}\n0000000000 65535 f \n'.format(self.count)
+        xref_parts = ['\nxref\n0 {}\n0000000000 65535 f \n'.format(self.count)]
 
         for i, obj in enumerate(self.content):
-            xref += str(count).zfill(10) + ' 00000 n \n'
+            xref_parts.append(str(count).zfill(10) + ' 00000 n \n')
 
             obj_bytes = parse_obj(obj)
-            bytes_ = subs('{} 0 obj\n', i + 1) + obj_bytes + \
-                '\nendobj\n'.encode('latin')
+            bytes_ = f'{i + 1} 0 obj\n'.encode('latin') + obj_bytes + \
+                b'\nendobj\n'
             count += len(bytes_)
-            buffer.write(bytes_)
+            output_ += bytes_
 
         self.trailer['Size'] = self.count
         if 'ID' not in self.trailer:
@@ -142,10 +169,15 @@ class PDFBase:
 
         footer = '\nstartxref\n{}\n%%EOF'.format(count + 1)
 
-        buffer.write(
-            (xref + 'trailer\n').encode('latin') + trailer +
-            footer.encode('latin')
-        )
+        xref_parts.append('trailer\n')
+        output_ += ''.join(xref_parts).encode('latin')
+        output_ += trailer
+        output_ += footer.encode('latin')
+        buffer.write(output_)
 
 from .parser import PDFObject, PDFRef, parse_obj
 from .utils import subs
+
+ALLOWED_TYPES = (
+    dict, list, tuple, set, bytes, bool, int, float, str, PDFObject
+)
@@ -163,15 +163,18 @@ class PDFColor:
         stroke (bool, optional): Whether this is a color for stroke(True)
             or for fill(False). Defaults to False.
     """
+    __slots__ = ('color', 'stroke', '_str_cache')
 
     def __init__(
         self, color: Union[ColorType, 'PDFColor'], stroke: bool=False
     ) -> None:
         if isinstance(color, PDFColor):
-            self.color = copy(color.color)
+            color_ = color.color
+            self.color = None if color_ is None else list(color_)
         else:
             self.color = parse_color(color)
         self.stroke = stroke
+        self._str_cache = None
 
     def __eq__(self, color):
         if color is None: return self.color is None
@@ -186,17 +189,23 @@ class PDFColor:
         return self.color != color.color or self.stroke != color.stroke
 
     def __str__(self):
+        if self._str_cache is not None:
+            return self._str_cache
         if self.color is None:
-            return ''
-        if len(self.color) == 1:
-            return '{} {}'.format(
+            value = ''
+        elif len(self.color) == 1:
+            value = '{} {}'.format(
                 round(self.color[0], 3), 'G' if self.stroke else 'g'
             )
-        if len(self.color) == 3:
-            return '{} {} {} {}'.format(
+        elif len(self.color) == 3:
+            value = '{} {} {} {}'.format(
                 *[round(color, 3) for color in self.color[0:3]],
                 'RG' if self.stroke else 'rg'
             )
+        else:
+            return None
+        self._str_cache = value
+        return value
 
 def parse_color(color: ColorType) -> list:
     """Function to parse ``color`` into a list representing a PDF color.
@@ -266,5 +275,3 @@ def parse_color(color: ColorType) -> list:
             return [float(c) for c in color[:4]]
         except:
             raise TypeError("Couldn't parse numeric color value: {}".format(color))
-
-from .utils import copy
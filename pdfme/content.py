@@ -865,7 +865,7 @@ class PDFContentPart:
             element['image'], element.get('extension'),
             element.get('image_name')
         )
-        height = self.width * pdf_image.height / pdf_image.width
+        height = self.width * pdf_image.aspect
 
         if height < self.max_height:
             self.p.parts.append({
@@ -1,4 +1,5 @@
 import abc
+from array import array
 from io import BytesIO
 from pathlib import Path
 
@@ -53,6 +54,8 @@ class PDFFont(abc.ABC):
     """
     def __init__(self, ref: str) -> None:
         self._ref = ref
+        self._char_width_cache = {}
+        self._word_width_cache = {}
 
     @property
     def ref(self) -> str:
@@ -118,7 +121,11 @@ class PDFStandardFont(PDFFont):
     def __init__(self, ref: str, base_font: str, widths: dict) -> None:
         super().__init__(ref)
         self._base_font = base_font
+        self._base_font_bytes = ('/' + base_font).encode('latin')
         self.widths = widths
+        self._scaled_widths = array(
+            'd', (widths[chr(i)] / 1000 for i in range(256))
+        )
 
     @property
     def base_font(self) -> str:
@@ -127,18 +134,19 @@ class PDFStandardFont(PDFFont):
 
     def get_char_width(self, char: str) -> float:
         """See :meth:`pdfme.fonts.PDFFont.get_char_width`"""
-        return self.widths[char] / 1000
+        return self._scaled_widths[ord(char)]
 
     def get_text_width(self, text) -> float:
         """See :meth:`pdfme.fonts.PDFFont.get_text_width`"""
-        return sum(self.widths[char] for char in text) / 1000
+        scaled_widths = self._scaled_widths
+        return sum(scaled_widths[ord(char)] for char in text)
 
     def add_font(self, base: 'PDFBase') -> 'PDFObject':
         """See :meth:`pdfme.fonts.PDFFont.add_font`"""
         font = base.add({
             'Type': b'/Font',
             'Subtype': b'/Type1',
-            'BaseFont': subs('/{}', self.base_font),
+            'BaseFont': self._base_font_bytes,
             'Encoding': b'/WinAnsiEncoding'
         })
         if self.base_font not in ['Symbol', 'ZapfDingbats']:
@@ -328,19 +336,37 @@ class PDFTrueTypeFont(PDFFont):
             'DescendantFonts': [font_cid.id],
             'ToUnicode': to_unicode_stream.id
         })
+def _build_standard_fonts() -> tuple:
+    """Function to build the shared PDFStandardFont instances for the fonts in
+    ``STANDARD_FONTS``.
+
+    Returns:
+        tuple: tuple with a dict of the fonts built, and the next font index.
+    """
+    fonts = {}
+    index = 1
+    for font_family, modes in STANDARD_FONTS.items():
+        fonts[font_family] = {}
+        for mode, font in modes.items():
+            fonts[font_family][mode] = PDFStandardFont(
+                'F'+str(index), font['base_font'], font['widths']
+            )
+            index += 1
+    return fonts, index
+
+_STANDARD_PDF_FONTS, _STANDARD_INDEX = _build_standard_fonts()
+
 class PDFFonts:
     """Class that represents the set of all the fonts added to a PDF document.
     """
     def __init__(self) -> None:
-        self.fonts = {}
-        self.index = 1
-        for font_family, modes in STANDARD_FONTS.items():
-            self.fonts[font_family] = {}
-            for mode, font in modes.items():
-                self.fonts[font_family][mode] = PDFStandardFont(
-                    'F'+str(self.index), font['base_font'], font['widths']
-                )
-                self.index += 1
+        self.fonts = {
+            font_family: dict(modes)
+            for font_family, modes in _STANDARD_PDF_FONTS.items()
+        }
+        self.index = _STANDARD_INDEX
+        self._mode_cache = {}
+        self._state_cache = {}
 
     def get_font(self, font_family: str, mode: str) -> PDFFont:
         """Method to get a font from its ``font_family`` and ``mode``.
@@ -353,8 +379,28 @@ class PDFFonts:
         Returns:
             PDFFont: an object that represents a PDF font.
         """
-        family = self.fonts[font_family]
-        return family['n'] if mode not in family else family[mode]
+        return self.fonts[font_family][self.get_mode(font_family, mode)]
+
+    def get_mode(self, font_family: str, mode: str) -> str:
+        """Method to get the effective mode for the ``font_family`` and
+        ``mode`` passed: the mode itself if the family has it, or ``n``
+        otherwise. Hits and misses are cached, so repeated lookups of a
+        missing mode (like an italic ``Symbol``) are a single dict access.
+
+        Args:
+            font_family (str): the name of the font family
+            mode (str): the mode of the font you want to get. ``n``, ``b``,
+                ``i`` or ``bi``.
+
+        Returns:
+            str: the effective mode.
+        """
+        key = (font_family, mode)
+        effective_mode = self._mode_cache.get(key)
+        if effective_mode is None:
+            effective_mode = mode if mode in self.fonts[font_family] else 'n'
+            self._mode_cache[key] = effective_mode
+        return effective_mode
 
     def load_font(self, path: str, font_family: str, mode: str='n') -> None:
         """Method to add a TrueType font to this instance.
@@ -370,6 +416,8 @@ class PDFFonts:
             self.fonts[font_family] = {'n': font}
         self.fonts[font_family][mode] = font
         self.index += 1
+        self._mode_cache.clear()
+        self._state_cache.clear()
 
 from .parser import PDFObject
 from .base import PDFBase
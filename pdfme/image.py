@@ -125,6 +125,7 @@ class PDFImage:
 
         self.width = int(w)
         self.height = int(h)
+        self.aspect = self.height / self.width
 
         self.pdf_obj = {
             'Type': b'/XObject',
@@ -4,6 +4,8 @@ Number = Union[int, float]
 PageType = Union[Number, str, Iterable[Number]]
 MarginType = Union[int, float, Iterable[Number], dict]
 
+ANNOT_DEFAULTS = {'Type': b'/Annot', 'Subtype': b'/Link'}
+
 class PDFPage:
     """Class that represents a PDF page, and has methods to add stream parts
     into the internal page PDF Stream Object, and other things like
@@ -38,9 +40,14 @@ class PDFPage:
 
         self.stream = base.add({'Filter': b'/FlateDecode', '__stream__': {}})
         self.page = base.add({
-            'Type': b'/Page', 'Contents': self.stream.id, 'Resources': {}
+            'Type': b'/Page', 'Contents': self.stream.id,
+            'Resources': {'Font': {}, 'XObject': {}}
         })
+        self._stream_contents = self.stream['__stream__']
+        self._font_resources = self.page['Resources']['Font']
+        self._x_object_resources = self.page['Resources']['XObject']
         self.x_objects = {}
+        self.fonts = set()
         self.current_id = 0
 
     @property
@@ -83,7 +90,7 @@ class PDFPage:
         if isinstance(content, str):
             content = content.encode('latin')
         current_id = self.current_id
-        self.stream['__stream__'][current_id] = content
+        self._stream_contents[current_id] = content
         self.current_id += 1
         return current_id
 
@@ -98,8 +105,10 @@ class PDFPage:
             font_obj_id (PDFRef): the object id of the font being referenced
                 here, already added to a :class:`pdfme.base.PDFBase` instance.
         """
-        self.page['Resources'].setdefault('Font', {})
-        self.page['Resources']['Font'][font_ref] = font_obj_id
+        if font_ref in self.fonts:
+            return
+        self.fonts.add(font_ref)
+        self._font_resources[font_ref] = font_obj_id
 
     def add_annot(self, obj: dict, rect: list) -> None:
         """Method to add a PDF annotation to this page.
@@ -117,7 +126,7 @@ class PDFPage:
         """
         if not 'Annots' in self.page:
             self.page['Annots'] = []
-        _obj = {'Type': b'/Annot', 'Subtype': b'/Link'}
+        _obj = dict(ANNOT_DEFAULTS)
         _obj.update(obj)
         _obj['Rect'] = rect
         self.page['Annots'].append(_obj)
@@ -158,17 +167,15 @@ class PDFPage:
             width (int, float): the width of the image.
             height (int, float): the height of the image.
         """
-        self.page['Resources'].setdefault('XObject', {})
         if not image_obj_id in self.x_objects:
-            image_id = 'Im{}'.format(len(self.page['Resources']['XObject']))
-            self.page['Resources']['XObject'][image_id] = image_obj_id
+            image_id = 'Im{}'.format(len(self._x_object_resources))
+            self._x_object_resources[image_id] = image_obj_id
             self.x_objects[image_obj_id] = image_id
 
         self.add(
-            ' q {} 0 0 {} {} {} cm /{} Do Q'.format(
-                round(width, 3), round(height, 3), round(self.x, 3),
-                round(self._y, 3), self.x_objects[image_obj_id]
-            )
+            f' q {round(width, 3)} 0 0 {round(height, 3)} {round(self.x, 3)}'
+            f' {round(self._y, 3)} cm /{self.x_objects[image_obj_id]} Do Q'
+            .encode('latin')
         )
 
 from .base import PDFBase
@@ -1,5 +1,7 @@
 import re
 from typing import Iterable, Union
+
+_PARENS_SUB = re.compile(r'([()])').sub
 class PDFObject:
     """A class that represents a PDF object.
 
@@ -81,7 +83,7 @@ def parse_obj(obj: ObjectType) -> bytes:
     elif isinstance(obj, (int, float)):
         return str(obj).encode('latin')
     elif isinstance(obj, str):
-        return ('(' + re.sub(r'([()])', r'\\\1', obj) + ')').encode('latin')
+        return ('(' + _PARENS_SUB(r'\\\1', obj) + ')').encode('latin')
 
 
 def parse_dict(obj: dict) -> bytes:
@@ -9,6 +9,9 @@ MarginType = Union[int, float, Iterable[Number], dict]
 ColorType = Union[int, float, str, list, tuple]
 ImageType = Union[str, Path, BytesIO]
 TextType = Union[str, list, tuple, dict]
+
+PAGES_TYPE = b'/Pages'
+URI_ACTION = {'Type': b'/Action', 'S': b'/URI'}
 class PDF:
     """Class that represents a PDF document, and has methods to add pages,
     and to add paragraphs, images, tables and a mix of this, a content box,
@@ -143,6 +146,15 @@ class PDF:
         outlines_level (int, optional): the level of the outlines to be
             displayed on the outlines panel when the PDF document is opened.
     """
+    __slots__ = (
+        'page_width', 'page_height', 'rotate_page', 'margin',
+        '_default_page_dims', 'page_numbering_offset', 'page_numbering_style',
+        'font_family', 'font_size', 'font_color', 'text_align', 'line_height',
+        'indent', 'outlines_level', 'formats', 'context',
+        '_par_style_cache_key', '_par_style_cache', 'dests', 'uris', 'pages',
+        'running_sections', 'outlines', 'base', 'root', 'fonts', 'used_fonts',
+        'images', '_image_cache', '_page_index'
+    )
     def __init__(
         self, page_size: PageType='a4', rotate_page: bool=False,
         margin: MarginType=56.693, page_numbering_offset: Number=0,
@@ -165,6 +177,9 @@ class PDF:
         self.formats = {}
         self.context = {}
 
+        self._par_style_cache_key = None
+        self._par_style_cache = None
+
         self.dests = {}
         self.uris = {}
         self.pages = []
@@ -178,6 +193,7 @@ class PDF:
         self.fonts = PDFFonts()
         self.used_fonts = {}
         self.images = {}
+        self._image_cache = {}
         self._add_or_get_font('Helvetica', 'n')
 
     @property
@@ -240,6 +256,11 @@ class PDF:
         if margin is not None:
             self.margin = parse_margin(margin)
 
+        self._default_page_dims = (
+            (self.page_height, self.page_width) if self.rotate_page
+            else (self.page_width, self.page_height)
+        )
+
     def add_page(
         self, page_size: PageType=None, rotate_page: bool=None,
         margin: MarginType=None
@@ -256,13 +277,16 @@ class PDF:
             margin (str, int, float, tuple, list, dict, optional): the margins
                 of the page. See :func:`pdfme.utils.parse_margin`.
         """
-        if page_size is not None:
-            page_width, page_height = get_page_size(page_size)
+        if page_size is None and rotate_page is None:
+            page_width, page_height = self._default_page_dims
         else:
-            page_height, page_width = self.page_height, self.page_width
+            if page_size is not None:
+                page_width, page_height = get_page_size(page_size)
+            else:
+                page_width, page_height = self.page_width, self.page_height
 
-        if (rotate_page is None and self.rotate_page) or rotate_page:
-            page_height, page_width = page_width, page_height
+            if (rotate_page is None and self.rotate_page) or rotate_page:
+                page_height, page_width = page_width, page_height
 
         margin_ = copy(self.margin)
         if margin is not None:
@@ -341,8 +365,8 @@ class PDF:
             return self.used_fonts[f]
         font = self.fonts.get_font(*f)
         font_obj = font.add_font(self.base)
-        self.used_fonts[(font_family, mode)] = (font.ref, font_obj.id)
-        return font.ref, font_obj.id
+        font_args = self.used_fonts[f] = (font.ref, font_obj.id)
+        return font_args
 
     def _used_font(self, font_family: str, mode: str) -> None:
         """Method to add a font to the current page.
@@ -400,16 +424,15 @@ class PDF:
         else:
             image_obj = self.base[self.images[pdf_image.image_name]]
 
-        h = pdf_image.height
-        w = pdf_image.width
+        aspect = pdf_image.aspect
 
         if width is None and height is None:
             width = self.page.content_width
-            height = width * h/w
+            height = width * aspect
         elif width is None:
-            width = height * w/h
+            width = height / aspect
         elif height is None:
-            height = width * h/w
+            height = width * aspect
 
         if x is not None:
             self.page.x = x
@@ -419,8 +442,8 @@ class PDF:
         self.page.add_image(image_obj.id, width, height)
 
         if move == 'bottom':
-            self.page.y += height
-        if move == 'next':
+            self.page._y -= height
+        elif move == 'next':
             self.page.x += width
 
     def image(
@@ -451,7 +474,14 @@ class PDF:
                 page y coordinate to the bottom of the image (``bottom``)
                 (default).
         """
-        pdf_image = self.create_image(image, extension, image_name)
+        if isinstance(image, (str, Path)):
+            key = str(image)
+            pdf_image = self._image_cache.get(key)
+            if pdf_image is None:
+                pdf_image = self.create_image(image, extension, image_name)
+                self._image_cache[key] = pdf_image
+        else:
+            pdf_image = self.create_image(image, extension, image_name)
         self.add_image(
             pdf_image, x=x, y=y, width=width, height=height, move=move
         )
@@ -476,16 +506,32 @@ class PDF:
         Returns:
             dict: dict with the default and the given parameters combined.
         """
-        return dict(
+        use_defaults = (
+            width is None and height is None and text_align is None and
+            line_height is None and indent is None
+        )
+        if use_defaults:
+            cache_key = (
+                self._page_index, self.page.x, self.page._y, self.text_align,
+                self.line_height, self.indent
+            )
+            if cache_key == self._par_style_cache_key:
+                return dict(self._par_style_cache)
+
+        par_style = dict(
             width = self.page.width - self.page.margin_right - self.page.x \
                 if width is None else width,
-            height = self.page.height - self.page.margin_bottom - self.page.y \
+            height = self.page._y - self.page.margin_bottom \
                 if height is None else height,
             text_align = self.text_align if text_align is None else text_align,
             line_height = self.line_height if line_height is None \
                 else line_height,
             indent = self.indent if indent is None else indent,
         )
+        if use_defaults:
+            self._par_style_cache_key = cache_key
+            self._par_style_cache = dict(par_style)
+        return par_style
 
     def _init_text(self, content: TextType) -> dict:
         """Method that prepares the paragraph passed as argument to be used in
@@ -509,6 +555,7 @@ class PDF:
             if len(style_str) > 0:
                 style.update(parse_style_str(style_str[0], self.fonts))
             style.update(process_style(content.get('style'), self))
+            content = content.copy()
             content['style'] = style
         return content
 
@@ -537,7 +584,7 @@ class PDF:
         if width is None:
             width = self.page.width - self.page.margin_right - self.page.x
         if height is None:
-            height = self.page.height - self.page.margin_bottom - self.page.y
+            height = self.page._y - self.page.margin_bottom
         return self.page.x, self.page._y, width, height
 
     def get_page_number(self) -> str:
@@ -589,7 +636,8 @@ class PDF:
         :meth:`pdfme.text.PDFTextBase.result`
         """
         stream = get_paragraph_stream(x, y, text_stream, graphics_stream)
-        self.page.add(stream)
+        if stream != '':
+            self.page.add(stream.encode('latin'))
 
         for font in used_fonts:
             self._used_font(*font)
@@ -616,9 +664,9 @@ class PDF:
             elif id_.startswith('$uri:'):
                 link = id_[5:]
                 if not link in self.uris:
-                    uri = self.base.add(
-                        {'Type': b'/Action', 'S': b'/URI', 'URI': link}
-                    )
+                    uri_obj = dict(URI_ACTION)
+                    uri_obj['URI'] = link
+                    uri = self.base.add(uri_obj)
                     self.uris[link] = uri.id
 
                 for r in rects:
@@ -638,8 +686,8 @@ class PDF:
                 outline.append(outline_data)
 
         if move == 'bottom':
-            self.page.y += height
-        if move == 'next':
+            self.page._y -= height
+        elif move == 'next':
             self.page.x += width
 
     def _text(
@@ -773,8 +821,8 @@ class PDF:
         self._add_parts(pdf_table.parts)
 
         if move == 'bottom':
-            self.page.y += pdf_table.current_height
-        if move == 'next':
+            self.page._y -= pdf_table.current_height
+        elif move == 'next':
             self.page.x += width
 
         return pdf_table
@@ -851,8 +899,8 @@ class PDF:
         self._add_parts(pdf_content.parts)
 
         if move == 'bottom':
-            self.page.y += pdf_content.current_height
-        if move == 'next':
+            self.page._y -= pdf_content.current_height
+        elif move == 'next':
             self.page.x += width
 
         return pdf_content
@@ -883,7 +931,8 @@ class PDF:
                 streams.
         """
         stream = create_graphics(graphics)
-        self.page.add(stream)
+        if stream != '':
+            self.page.add(stream.encode('latin'))
 
     def _add_parts(self, parts: Iterable) -> None:
         """Method to add a list of parts to current page.
@@ -906,38 +955,41 @@ class PDF:
             elif type_ == 'image':
                 self.add_image(**part)
 
-    def _build_pages_tree(self, page_list:list, first_level:bool=True) -> None:
+    def _build_pages_tree(self, page_list: list) -> None:
         """Method to build the PDF pages tree.
 
         Args:
-            page_list (list): a list of PDF page objects or PDFPage objects to
-                be added to the PDF pages tree.
-            first_level (bool, optional): whether you are calling this method
-                from outside (True) or recursively from inside (False).
+            page_list (list): a list of PDFPage objects to be added to the PDF
+                pages tree.
         """
-        new_page_list = []
-        count = 0
+        level = []
         for page in page_list:
-            if first_level:
-                page_size = [page.width, page.height]
-                page = page.page
-                page['MediaBox'] = [0, 0] + page_size
-
-            if count % 6 == 0:
-                new_page_list.append(
-                    self.base.add({'Type': b'/Pages', 'Kids': [], 'Count': 0})
-                )
-                count += 1
-
-            last_parent = new_page_list[-1]
-            page['Parent'] = last_parent.id
-            last_parent['Kids'].append(page.id)
-            last_parent['Count'] += 1
-
-        if count == 1:
-            self.root['Pages'] = new_page_list[0].id
-        else:
-            self._build_pages_tree(new_page_list, False)
+            page_obj = page.page
+            page_obj['MediaBox'] = [0, 0, page.width, page.height]
+            level.append(page_obj)
+
+        counts = [1] * len(level)
+        while True:
+            chunks = [level[i:i + 6] for i in range(0, len(level), 6)]
+            new_counts = [
+                sum(counts[i:i + 6]) for i in range(0, len(counts), 6)
+            ]
+            new_level = self.base.add_many(
+                {
+                    'Type': PAGES_TYPE, 'Kids': [obj.id for obj in chunk],
+                    'Count': count
+                }
+                for chunk, count in zip(chunks, new_counts)
+            )
+            for parent, chunk in zip(new_level, chunks):
+                for obj in chunk:
+                    obj['Parent'] = parent.id
+
+            if len(new_level) == 1:
+                self.root['Pages'] = new_level[0].id
+                return
+            level = new_level
+            counts = new_counts
 
     def _build_dests_tree(
         self, keys: list, vals: list, first_level: bool=True
@@ -1,11 +1,18 @@
 import json
-import re
 from typing import Optional, Union
 from uuid import uuid4
 
 PARAGRAPH_DEFAULTS = {'text_align': 'l', 'line_height': 1.1, 'indent': 0}
 TEXT_DEFAULTS = {'f': 'Helvetica', 'c': 0.1, 's': 11, 'r': 0, 'bg': None}
 
+_COMPARE_CACHE = {}
+_COMPARE_CACHE_MAX_SIZE = 1024
+_WORD_WIDTH_CACHE_MAX_SIZE = 8192
+
+_STATUS_ADDED = {'status': 'added'}
+_STATUS_IGNORED = {'status': 'ignored'}
+_STATUS_PREADDED = {'status': 'preadded'}
+
 ContentType = Union[str, list, tuple, dict]
 Number = Union[int, float]
 class PDFState:
@@ -19,6 +26,50 @@ class PDFState:
         fonts (PDFFonts): the fonts instance with the information about
             the fonts already added to the PDF document.
     """
+    __slots__ = (
+        'font_family', 'font_mode', 'font', 'size', 'color', 'rise', '_key'
+    )
+
+    @classmethod
+    def get(cls, style: dict, fonts: 'PDFFonts') -> 'PDFState':
+        """Method to get a shared PDFState for the style passed, building
+        it only if an identical state was not created before. States are
+        immutable after construction, so they can be safely shared. The
+        cache lives on the ``fonts`` instance and is cleared when a new
+        font is loaded, so new modes are picked up.
+
+        Args:
+            style (dict): the paragraph line part style.
+            fonts (PDFFonts): the fonts instance with the information about
+                the fonts already added to the PDF document.
+
+        Returns:
+            PDFState: a shared state instance.
+        """
+        color = style['c']
+        if isinstance(color, PDFColor):
+            color_ = color.color
+            color = (
+                None if color_ is None else tuple(color_), color.stroke
+            )
+        elif isinstance(color, list):
+            color = tuple(color)
+        cache = fonts._state_cache
+        cache_key = (
+            style['f'], style.get('b', False),
+            style.get('i', False), style['s'], color, style.get('r', 0)
+        )
+        try:
+            state = cache.get(cache_key)
+        except TypeError:
+            return cls(style, fonts)
+        if state is None:
+            state = cls(style, fonts)
+            if len(cache) >= _COMPARE_CACHE_MAX_SIZE:
+                cache.clear()
+            cache[cache_key] = state
+        return state
+
     def __init__(self, style: dict, fonts: 'PDFFonts') -> None:
         self.font_family = style['f']
 
@@ -29,13 +80,19 @@ class PDFState:
             f_mode += 'i'
         if f_mode == '':
             f_mode = 'n'
-        self.font_mode = 'n' if not f_mode in fonts.fonts[style['f']] else f_mode
+        self.font_mode = fonts.get_mode(self.font_family, f_mode)
 
-        self.font = fonts.get_font(self.font_family, self.font_mode)
+        self.font = fonts.fonts[self.font_family][self.font_mode]
 
         self.size = style['s']
         self.color = PDFColor(style['c'])
         self.rise = style.get('r', 0) * self.size
+        self._key = (
+            self.font.ref, round(self.size, 3),
+            None if self.color.color is None else
+            (tuple(self.color.color), self.color.stroke),
+            round(self.rise, 3)
+        )
 
     def compare(self, other: Optional['PDFState']) -> str:
         """Compares this state, with state ``other`` and returns a PDF stream
@@ -47,6 +104,11 @@ class PDFState:
         Returns:
             str: a PDF stream with the differences between both states.
         """
+        cache_key = (self._key, None if other is None else other._key)
+        cached = _COMPARE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         ret_value = ''
         if (
             other is None or self.font_family != other.font_family or
@@ -58,6 +120,9 @@ class PDFState:
         if other is None or self.rise != other.rise:
             ret_value += ' {} Ts'.format(round(self.rise, 3))
 
+        if len(_COMPARE_CACHE) >= _COMPARE_CACHE_MAX_SIZE:
+            _COMPARE_CACHE.clear()
+        _COMPARE_CACHE[cache_key] = ret_value
         return ret_value
 
 class PDFTextLinePart:
@@ -69,17 +134,28 @@ class PDFTextLinePart:
             the fonts already added to the PDF document.
         ids (list, optional): the ids of this part.
     """
+    __slots__ = (
+        'fonts', 'style', 'state', 'underline', 'background', 'ids', 'width',
+        'words', '_font', '_size', '_char_widths', '_word_widths',
+        'space_width', 'spaces_width'
+    )
     def __init__(self, style: dict, fonts: 'PDFFonts', ids: list=None) -> None:
         self.fonts = fonts
 
         self.style = style
-        self.state = PDFState(style, fonts)
+        self.state = PDFState.get(style, fonts)
         self.underline = style.get('u', False)
         self.background = PDFColor(style.get('bg'))
         self.ids = [] if id is None else ids
         self.width = 0
         self.words = []
 
+        self._font = self.state.font
+        self._size = self.state.size
+        self._char_widths = \
+            self._font._char_width_cache.setdefault(self._size, {})
+        self._word_widths = \
+            self._font._word_width_cache.setdefault(self._size, {})
         self.space_width = self.get_char_width(' ')
         self.spaces_width = 0
 
@@ -114,6 +190,26 @@ class PDFTextLinePart:
         else:
             self.width += self.get_word_width(word)
 
+    def extend_words(self, words: list) -> None:
+        """Function to add several words to this part at once, updating
+        the width totals once instead of once per word.
+
+        Args:
+            words (list): the words.
+        """
+        width = 0
+        spaces_width = 0
+        space_width = self.space_width
+        get_word_width = self.get_word_width
+        for word in words:
+            if word == ' ':
+                spaces_width += space_width
+            else:
+                width += get_word_width(word)
+        self.words.extend(words)
+        self.width += width
+        self.spaces_width += spaces_width
+
     def current_width(self, factor: Number=1) -> float:
         """Return the width of this part, according to the words added to this
         part, using ``factor`` to calculate this width of the spaces in this
@@ -153,7 +249,11 @@ class PDFTextLinePart:
         Returns:
             float: the width of the character passed.
         """
-        return self.state.size * self.state.font.get_char_width(char)
+        width = self._char_widths.get(char)
+        if width is None:
+            width = self._size * self._font.get_char_width(char)
+            self._char_widths[char] = width
+        return width
 
     def get_word_width(self, word: str) -> float:
         """The width of the word passed.
@@ -164,7 +264,13 @@ class PDFTextLinePart:
         Returns:
             float: the width of the word passed.
         """
-        return self.state.size * self.state.font.get_text_width(word)
+        width = self._word_widths.get(word)
+        if width is None:
+            width = self._size * self._font.get_text_width(word)
+            if len(self._word_widths) >= _WORD_WIDTH_CACHE_MAX_SIZE:
+                self._word_widths.clear()
+            self._word_widths[word] = width
+        return width
 
 class PDFTextLine:
     """Class that represents a line of a paragraph.
@@ -184,6 +290,13 @@ class PDFTextLine:
         top_margin (Number, optional): if not None, this is the top margin of
             the line, added to the actual line height.
     """
+    __slots__ = (
+        'fonts', 'max_width', 'line_parts', 'words_width', 'spaces_width',
+        '_max_size', '_max_rise', '_max_neg_rise',
+        'justify_min_factor', 'text_align', 'factor', 'top_margin',
+        'next_line', '_pending_part', 'is_last_word_space', 'firstWordAdded',
+        'started'
+    )
     def __init__(
         self, fonts: 'PDFFonts', max_width: Number=0, text_align: str=None,
         top_margin: Number=0
@@ -191,6 +304,11 @@ class PDFTextLine:
         self.fonts = fonts
         self.max_width = max_width
         self.line_parts = []
+        self.words_width = 0
+        self.spaces_width = 0
+        self._max_size = 0
+        self._max_rise = 0
+        self._max_neg_rise = 0
 
         self.justify_min_factor = 0.7
         self.text_align = PARAGRAPH_DEFAULTS['text_align'] \
@@ -200,6 +318,7 @@ class PDFTextLine:
 
         self.top_margin = top_margin
         self.next_line = None
+        self._pending_part = None
         self.is_last_word_space = True
         self.firstWordAdded = False
         self.started = False
@@ -212,15 +331,7 @@ class PDFTextLine:
         Returns:
             float: the line height.
         """
-        top = 0
-        height_ = 0
-        for part in self.line_parts:
-            if part.state.rise > 0 and part.state.rise > top:
-                top = part.state.rise
-            if part.state.size > height_:
-                height_ = part.state.size
-
-        return height_ + self.top_margin + top
+        return self._max_size + self.top_margin + self._max_rise
 
     @property
     def min_width(self) -> float:
@@ -231,8 +342,7 @@ class PDFTextLine:
         Returns:
             float: the line width.
         """
-        ws = self.get_widths()
-        return ws[0] + ws[1] * self.factor
+        return self.words_width + self.spaces_width * self.factor
 
     @property
     def bottom(self) -> float:
@@ -242,11 +352,7 @@ class PDFTextLine:
         Returns:
             float: the line bottom.
         """
-        bottom = 0
-        for part in self.line_parts:
-            if part.state.rise < 0 and -part.state.rise > bottom:
-                bottom = -part.state.rise
-        return bottom
+        return self._max_neg_rise
 
     def get_widths(self) -> tuple:
         """This function returns the widths of the line.
@@ -255,12 +361,7 @@ class PDFTextLine:
             tuple: of 2 elements, the width on the words as the first, and the
                 width of the spaces as the second.
         """
-        words_width = 0
-        spaces_width = 0
-        for part in self.line_parts:
-            words_width += part.width
-            spaces_width += part.spaces_width
-        return words_width, spaces_width
+        return self.words_width, self.spaces_width
 
     def add_line_part(self, style:dict=None, ids:list=None) -> PDFTextLinePart:
         """Add a new line part to this line.
@@ -277,25 +378,93 @@ class PDFTextLine:
                 self.fonts, self.max_width, self.text_align
             )
 
+        if self.next_line._pending_part is not None:
+            self.next_line._materialize_pending_part()
         line_part = PDFTextLinePart(style, self.fonts, ids)
         self.next_line.line_parts.append(line_part)
+        self.next_line._update_part_metrics(line_part)
+        return line_part
+
+    def _update_part_metrics(self, part: PDFTextLinePart) -> None:
+        """Method to update the running size and rise maximums with the
+        part passed, so properties ``height`` and ``bottom`` stay O(1).
+
+        Args:
+            part (PDFTextLinePart): the part just added to this line.
+        """
+        state = part.state
+        if state.size > self._max_size:
+            self._max_size = state.size
+        rise = state.rise
+        if rise > 0:
+            if rise > self._max_rise:
+                self._max_rise = rise
+        elif -rise > self._max_neg_rise:
+            self._max_neg_rise = -rise
+
+    def _materialize_pending_part(self) -> PDFTextLinePart:
+        """Method to build and append the line part whose creation was
+        deferred by method ``add_accumulated``.
+
+        Returns:
+            PDFTextLinePart: The materialized line part.
+        """
+        style, ids = self._pending_part
+        self._pending_part = None
+        line_part = PDFTextLinePart(style, self.fonts, ids)
+        self.line_parts.append(line_part)
+        self._update_part_metrics(line_part)
         return line_part
 
     def add_accumulated(self) -> None:
         """Function to add the parts accumulated in the auxiliar line (
         ``next_line`` attribute) to this line.
         """
+        next_line = self.next_line
+        if next_line._pending_part is not None:
+            next_line._materialize_pending_part()
         if len(self.line_parts):
-            for word in self.next_line.line_parts[0].words:
-                self.line_parts[-1].add_word(word)
-            self.next_line.line_parts = self.next_line.line_parts[1:]
-
-        self.line_parts.extend(self.next_line.line_parts)
+            last_part = self.line_parts[-1]
+            words_width = last_part.width
+            spaces_width = last_part.spaces_width
+            last_part.extend_words(next_line.line_parts[0].words)
+            self.words_width += last_part.width - words_width
+            self.spaces_width += last_part.spaces_width - spaces_width
+            next_line.line_parts = next_line.line_parts[1:]
+
+        for part in next_line.line_parts:
+            self.words_width += part.width
+            self.spaces_width += part.spaces_width
+            self._update_part_metrics(part)
+        self.line_parts.extend(next_line.line_parts)
         last_part = self.line_parts[-1]
         last_part.add_word(' ')
-        self.next_line.line_parts = [
-            PDFTextLinePart(last_part.style, self.fonts, last_part.ids)
-        ]
+        self.spaces_width += last_part.space_width
+        next_line.line_parts = []
+        next_line._pending_part = (last_part.style, last_part.ids)
+        next_line.words_width = 0
+        next_line.spaces_width = 0
+        next_line._max_size = 0
+        next_line._max_rise = 0
+        next_line._max_neg_rise = 0
+
+    def _add_word_to_next_line(self, word: str) -> None:
+        """Method to add a word to the last part of the auxiliar line,
+        keeping that line's running width totals up to date.
+
+        Args:
+            word (str): The word to be added.
+        """
+        next_line = self.next_line
+        if next_line._pending_part is None:
+            part = next_line.line_parts[-1]
+        else:
+            part = next_line._materialize_pending_part()
+        if word == ' ':
+            next_line.spaces_width += part.space_width
+        else:
+            next_line.words_width += part.get_word_width(word)
+        part.add_word(word)
 
     def add_word(self, word:str) -> dict:
         """Function to add a word to this line.
@@ -321,45 +490,60 @@ class PDFTextLine:
 
         """
         if not self.started:
-            if word.isspace():
+            if word == ' ':
                 if self.firstWordAdded:
                     self.started = True
                     self.add_accumulated()
-                    return {'status': 'added'}
+                    return _STATUS_ADDED
                 else:
-                    return {'status': 'ignored'}
+                    return _STATUS_IGNORED
             else:
                 self.firstWordAdded = True
-                self.next_line.line_parts[-1].add_word(word)
-                return {'status': 'added'}
+                self._add_word_to_next_line(word)
+                return _STATUS_ADDED
         else:
-            if word.isspace():
+            if word == ' ':
                 if self.is_last_word_space:
-                    return {'status': 'ignored'}
+                    return _STATUS_IGNORED
                 else:
                     self.add_accumulated()
-                    return {'status': 'added'}
+                    return _STATUS_ADDED
             else:
                 self.is_last_word_space = False
-                self.next_line.line_parts[-1].add_word(word)
-                if (self.min_width + self.next_line.min_width < self.max_width):
-                    return {'status': 'preadded'}
+                self._add_word_to_next_line(word)
+                next_line = self.next_line
+                factor = self.factor
+                if (
+                    self.words_width + self.spaces_width * factor +
+                    next_line.words_width + next_line.spaces_width * factor
+                    < self.max_width
+                ):
+                    return _STATUS_PREADDED
                 else:
-                    if (
-                        len(self.line_parts[-1].words) and
-                        self.line_parts[-1].words[-1] == ' '
-                    ):
-                        self.line_parts[-1].pop_word(-1)
-                    self.next_line.firstWordAdded = True
-                    self.next_line.top_margin = self.bottom
-                    self.next_line.next_line = PDFTextLine(
+                    last_part = self.line_parts[-1]
+                    if len(last_part.words) and last_part.words[-1] == ' ':
+                        last_part.pop_word(-1)
+                        self.spaces_width -= last_part.space_width
+                    next_line = self.next_line
+                    next_line.firstWordAdded = True
+                    next_line.top_margin = self.bottom
+                    next_line.next_line = PDFTextLine(
                         self.fonts, self.max_width, self.text_align
                     )
-                    line_parts = self.next_line.line_parts
-                    self.next_line.next_line.line_parts = line_parts
-                    self.next_line.line_parts = []
+                    next_line.next_line.line_parts = next_line.line_parts
+                    next_line.next_line.words_width = next_line.words_width
+                    next_line.next_line.spaces_width = next_line.spaces_width
+                    next_line.next_line._max_size = next_line._max_size
+                    next_line.next_line._max_rise = next_line._max_rise
+                    next_line.next_line._max_neg_rise = next_line._max_neg_rise
+                    next_line.line_parts = []
+                    next_line.words_width = 0
+                    next_line.spaces_width = 0
+                    next_line._max_size = 0
+                    next_line._max_rise = 0
+                    next_line._max_neg_rise = 0
                     return {
-                        'status': 'finished', 'new_line': self.next_line
+                        'status': 'finished', 'new_line': next_line
                     }
 
 class PDFTextBase:
@@ -477,7 +661,10 @@ class PDFTextBase:
         Returns:
             str: the stream.
         """
-        return get_paragraph_stream(self.x, self.y, self.text, self.graphics)
+        return get_paragraph_stream(
+            self.x, self.y,
+            ''.join(self.text_parts), ''.join(self.graphics_parts)
+        )
 
     @property
     def result(self) -> dict:
@@ -515,7 +702,8 @@ class PDFTextBase:
 
         return dict(
             x=self.x, y=self.y, width=self.width, height=self.current_height,
-            text_stream=self.text, graphics_stream=self.graphics,
+            text_stream=''.join(self.text_parts),
+            graphics_stream=''.join(self.graphics_parts),
             used_fonts=self.used_fonts, ids=self.ids,
         )
 
@@ -589,8 +777,8 @@ class PDFTextBase:
         """
         self.started = False
         self.lines = []
-        self.text = ''
-        self.graphics = ''
+        self.text_parts = []
+        self.graphics_parts = []
         self.ids = {}
         self.first_line_added = False
 
@@ -629,6 +817,9 @@ class PDFTextBase:
         """
         self.setup(x, y, width, height)
         self.init()
+        if len(self.content) == 0:
+            self.finished = True
+            return self.result
         for part_index in range(self.last_part, len(self.content)):
             part = self.content[part_index]
             if not isinstance(part, dict):
@@ -692,11 +883,21 @@ class PDFTextBase:
         ))
 
         if isinstance(words, str):
-            part['text'] = words = [
-                ' ' if w.isspace() else w
-                for w in re.split('( +)', words)
-                if w != ''
-            ]
+            if ' ' not in words:
+                tokens = [] if words == '' else \
+                    [' ' if words.isspace() else words]
+            else:
+                tokens = []
+                append = tokens.append
+                first = True
+                for token in words.split(' '):
+                    if first:
+                        first = False
+                    elif not tokens or tokens[-1] != ' ':
+                        append(' ')
+                    if token != '':
+                        append(' ' if token.isspace() else token)
+            part['text'] = words = tokens
         is_last_part = part_index == len(self.content) - 1
 
         for word_index in range(self.last_word, len(words)):
@@ -731,6 +932,10 @@ class PDFTextBase:
             bool: whether this line was successfully added (True) or not (False)
         """
         if is_last and self.current_line.next_line is not None:
+            for part in self.current_line.next_line.line_parts:
+                self.current_line.words_width += part.width
+                self.current_line.spaces_width += part.spaces_width
+                self.current_line._update_part_metrics(part)
             self.current_line.line_parts.extend(
                 self.current_line.next_line.line_parts
             )
@@ -751,7 +956,7 @@ class PDFTextBase:
             self.current_height += line_height
             self.lines.append(self.current_line)
             self.used_fonts.update(self.current_line_used_fonts)
-            self.current_line_used_fonts = set()
+            self.current_line_used_fonts.clear()
 
             self.add_line_to_stream(self.current_line, is_last)
             self.current_line = None
@@ -840,21 +1045,23 @@ class PDFTextBase:
                     first_indent += self.list_indent
                     if self.list_state.size > full_line_height:
                         full_line_height = self.list_state.size
-                    self.text += ' 0 -{} Td{} ({})Tj {} 0 Td'.format(
-                        round(full_line_height, 3),
-                        self.list_state.compare(self.last_state),
-                        self.list_text, first_indent
+                    self.text_parts.append(
+                        f' 0 -{round(full_line_height, 3)} Td'
+                        f'{self.list_state.compare(self.last_state)}'
+                        f' ({self.list_text})Tj {round(first_indent, 3)} 0 Td'
                     )
                 else:
-                    self.text += ' {} -{} Td'.format(
-                        round(first_indent, 3), round(full_line_height, 3)
+                    self.text_parts.append(
+                        f' {round(first_indent, 3)}'
+                        f' -{round(full_line_height, 3)} Td'
                     )
             else:
                 first_indent = adjusted_indent
                 if self.list_text:
                     first_indent += self.list_indent
-                self.text += ' {} -{} Td'.format(
-                    round(first_indent, 3), round(full_line_height, 3)
+                self.text_parts.append(
+                    f' {round(first_indent, 3)}'
+                    f' -{round(full_line_height, 3)} Td'
                 )
         else:
             if self.correct_indent:
@@ -863,8 +1070,10 @@ class PDFTextBase:
 
             full_line_height *= self.line_height
 
-            self.text += ' {} -{} Td'.format(round(adjusted_indent, 3),
-                                        round(full_line_height, 3))
+            self.text_parts.append(
+                f' {round(adjusted_indent, 3)}'
+                f' -{round(full_line_height, 3)} Td'
+            )
 
         self.y_ -= full_line_height
 
@@ -872,23 +1081,26 @@ class PDFTextBase:
 
         for part in line.line_parts:
             text = self.clean_words(part.words)
-            self.text += self.output_text(part, text, factor)
+            self.text_parts.append(self.output_text(part, text, factor))
             part_width = part.current_width(factor)
-            part_size = round(part.state.size, 3)
 
             if text != '' and not text.isspace():
-                if part.ids is not None:
+                if part.ids:
+                    part_size = round(part.state.size, 3)
+                    x_round = round(x, 3)
+                    x_end_round = round(x + part_width, 3)
                     for id_ in part.ids:
                         id_y = self.y_ + part.state.rise - part_size*0.25
                         self.ids.setdefault(id_, []).append([
-                            round(x, 3), round(id_y, 3),
-                            round(x + part_width, 3), round(id_y + part_size, 3)
+                            x_round, round(id_y, 3),
+                            x_end_round, round(id_y + part_size, 3)
                         ])
 
                 part_graphics = self.output_graphics(
                     part, x, self.y_, part_width
                 )
-                self.graphics += part_graphics
+                if part_graphics != '':
+                    self.graphics_parts.append(part_graphics)
             x += part_width
 
     def clean_words(self, words: list) -> str:
@@ -902,7 +1114,7 @@ class PDFTextBase:
             str: A string with all of the words passed.
         """
 
-        text = ''.join(word for word in words)
+        text = ''.join(words)
         if text != '':
             text = text.replace('\\',r'\\').replace('(','\(').replace(')','\)')
         return text
@@ -925,16 +1137,16 @@ class PDFTextBase:
         stream = part.state.compare(self.last_state)
         self.last_state = part.state
 
-        tw = round(part.space_width * (factor - 1), 3)
+        tw = 0 if factor == 1 else round(part.space_width * (factor - 1), 3)
         if self.last_factor != tw:
             if tw == 0:
                 tw = 0
-            stream += ' {} Tw'.format(tw)
+            stream += f' {tw} Tw'
             self.last_factor = tw
 
         if text != '':
             # TODO: How can we add unicode to PDF string
-            stream += ' ({})Tj'.format(text)
+            stream += f' ({text})Tj'
         return stream
 
     def output_graphics(
@@ -954,21 +1166,28 @@ class PDFTextBase:
             str: representing the PDF stream
         """
         graphics = ''
-        if part.background is not None and not part.background.color is None:
+        state = part.state
+        rise = state.rise
+        size = state.size
+        has_background = (
+            part.background is not None and part.background.color is not None
+        )
+        if has_background or part.underline:
+            x_q = round(x, 3)
+        if has_background:
             if part.background != self.last_fill:
                 self.last_fill = part.background
                 graphics += ' ' + str(self.last_fill)
 
-            graphics += ' {} {} {} {} re F'.format(
-                round(x, 3),
-                round(y + part.state.rise - part.state.size*0.25, 3),
-                round(part_width, 3), round(part.state.size*1.2, 3)
+            graphics += (
+                f' {x_q} {round(y + rise - size*0.25, 3)}'
+                f' {round(part_width, 3)} {round(size*1.2, 3)} re F'
             )
 
         if part.underline:
-            color = PDFColor(part.state.color, True)
-            stroke_width = part.state.size * 0.07
-            y_u = round(y + part.state.rise - stroke_width, 3)
+            color = PDFColor(state.color, True)
+            stroke_width = size * 0.07
+            y_u = round(y + rise - stroke_width, 3)
 
             if color != self.last_color:
                 self.last_color = color
@@ -976,10 +1195,10 @@ class PDFTextBase:
 
             if stroke_width != self.last_stroke_width:
                 self.last_stroke_width = stroke_width
-                graphics += ' {} w'.format(round(self.last_stroke_width, 3))
+                graphics += f' {round(stroke_width, 3)} w'
 
-            graphics += ' {} {} m {} {} l S'.format(
-                round(x, 3), y_u, round(x + part_width, 3), y_u
+            graphics += (
+                f' {x_q} {y_u} m {round(x + part_width, 3)} {y_u} l S'
             )
 
         return graphics
@@ -1195,7 +1414,10 @@ class PDFText(PDFTextBase):
                 :class:`pdfme.text.PDFTextBase`.
         """
         if last_part is not None and last_part['text'] == '':
-            self.content.remove(last_part)
+            if self.content[-1] is last_part:
+                self.content.pop()
+            else:
+                self.content.remove(last_part)
         text_part = {'style': style, 'text': '', 'ids': ids}
         if part_var is not None:
             text_part['var'] = part_var
@@ -1310,7 +1532,10 @@ class PDFText(PDFTextBase):
                 )
 
         if text_part is not None and text_part['text'] == '':
-            self.content.remove(text_part)
+            if self.content[-1] is text_part:
+                self.content.pop()
+            else:
+                self.content.remove(text_part)
 
 from .color import PDFColor
 from .fonts import PDFFonts
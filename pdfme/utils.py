@@ -111,28 +111,25 @@ def parse_margin(margin: MarginType) -> dict:
         return margin
 
     if isinstance(margin, str):
-        margin = re.split(',| ', margin)
-        if len(margin) == 1:
-            margin = float(margin)
-        else:
-            margin = [float(x) for x in margin]
+        margin = [float(x) for x in re.split(',| ', margin)]
 
     if isinstance(margin, (int, float)):
-        margin = [margin] * 4
+        margin = (margin,) * 4
 
     if isinstance(margin, (list, tuple)):
-        if len(margin) == 0:
-            margin = [0] * 4
-        elif len(margin) == 1:
-            margin = margin * 4
-        elif len(margin) == 2:
-            margin = margin * 2
-        elif len(margin) == 3:
-            margin = margin + [margin[1]]
-        elif len(margin) > 4:
-            margin = margin[0:4]
-
-        return {k: v for k, v in zip(['top', 'right', 'bottom', 'left'], margin)}
+        n = len(margin)
+        if n == 0:
+            margin = (0,) * 4
+        elif n == 1:
+            margin = tuple(margin) * 4
+        elif n == 2:
+            margin = tuple(margin) * 2
+        elif n == 3:
+            margin = (margin[0], margin[1], margin[2], margin[1])
+        else:
+            margin = tuple(margin[0:4])
+
+        return dict(zip(('top', 'right', 'bottom', 'left'), margin))
     else:
         raise TypeError('margin property must be of type str, int, list or dict')
 
@@ -74,6 +74,11 @@ def test_text_list_style_indent():
         'test_text_list_style_indent', 500
     )
 
+def test_text_whitespace_runs():
+    # a word plus space followed by a whitespace-only token used to raise
+    # an IndexError in PDFTextLine.add_accumulated
+    add_content({'.': ['a b \t c d \t\t e']}, {}, 'test_text_whitespace_runs')
+
 def get_content_list(content):
     for key, val in content.items():
         if key.startswith('.'):